@@ -28,6 +28,7 @@ Command Line Arguments:
     --port PORT: WebSocket server port (default: 3000)
     --host HOST: Host to bind the WebSocket server to (default: localhost)
     --static-dir DIR: Directory containing static files to serve (optional, uses built-in dist if not provided)
+    --reuse-port: Set SO_REUSEPORT so several d_back processes can listen on the same port
     --version: Display version information and exit
     --help: Display help message and exit
 
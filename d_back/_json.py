@@ -0,0 +1,28 @@
+"""JSON encoding helpers for the D-Back WebSocket server.
+
+Uses orjson when it is installed (``pip install d-back[fast]``) and falls back
+to the standard library json module otherwise. dumps() always returns a str so
+messages keep being sent as WebSocket text frames, which is what d-zone clients
+expect.
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    def dumps(obj: Any) -> str:
+        """Serialize obj to a JSON formatted str using orjson."""
+        # OPT_NON_STR_KEYS matches the stdlib behavior of accepting int keys
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    loads = orjson.loads
+else:
+    dumps = json.dumps
+    loads = json.loads
+
+__all__ = ["dumps", "loads"]
@@ -0,0 +1,18 @@
+"""Authentication helpers for the D-Back WebSocket server.
+
+This module contains helpers used when validating Discord OAuth2 users that
+connect to passworded servers.
+
+Examples:
+
+    from d_back import WebSocketServer
+    from d_back.auth import TokenCache
+
+    server = WebSocketServer()
+    # Keep successful validations for one minute instead of the default five
+    server.token_cache = TokenCache(ttl=60)
+"""
+
+from .token_cache import TokenCache
+
+__all__ = ['TokenCache']
@@ -0,0 +1,108 @@
+"""Time-limited cache of successful Discord OAuth2 validations.
+
+Validating a Discord OAuth2 token usually means a round trip to the Discord API,
+which is slow and rate limited. The WebSocketServer keeps successful validations
+in a TokenCache so a client reconnecting with the same token doesn't trigger
+another network call until the entry expires.
+
+Only successful validations are cached. A failed validation is never stored, so
+the next attempt always reaches the validation callback again.
+
+Tokens are never kept in memory as-is; entries are keyed by a 128-bit BLAKE2b
+digest of the token together with the user ID and Discord server ID it was
+validated for. BLAKE2b is faster than SHA-256 in software and a 128-bit digest
+is plenty to tell cached tokens apart.
+
+Examples:
+
+    from d_back.auth import TokenCache
+
+    cache = TokenCache(maxsize=1000, ttl=60)
+    if not cache.is_validated(token, user_id, server_id):
+        if await validate_with_discord(token, user_id, server_id):
+            cache.mark_validated(token, user_id, server_id)
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+
+
+class TokenCache:
+    """Cache of successful OAuth2 validations with a time-to-live and size limit.
+
+    Entries expire ttl seconds after they were stored. When the cache is full the
+    oldest entry is evicted first.
+
+    Attributes:
+        maxsize (int): Maximum number of cached validations.
+        ttl (float): Number of seconds a validation stays cached.
+
+    Examples:
+
+        cache = TokenCache(ttl=300)
+        cache.mark_validated("token", "user123", "232769614004748288")
+        cache.is_validated("token", "user123", "232769614004748288")  # True
+        cache.is_validated("token", "user123", "482241773318701056")  # False
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 300.0):
+        """Initialize an empty token cache.
+
+        Args:
+            maxsize: Maximum number of cached validations. Defaults to 10000.
+            ttl: Number of seconds a validation stays cached. Defaults to 300.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, float]" = OrderedDict()  # key -> expiry time
+
+    def is_validated(self, token: str, user_id: str, server_id: str) -> bool:
+        """Check whether a successful validation is cached and not yet expired.
+
+        Args:
+            token: Discord OAuth2 access token.
+            user_id: Discord user ID the token was validated for.
+            server_id: Discord server ID the token was validated for.
+
+        Returns:
+            bool: True if the validation is cached and still valid, False otherwise.
+        """
+        key = self._make_key(token, user_id, server_id)
+        expires_at = self._entries.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False
+        return True
+
+    def mark_validated(self, token: str, user_id: str, server_id: str) -> None:
+        """Store a successful validation.
+
+        Args:
+            token: Discord OAuth2 access token.
+            user_id: Discord user ID the token was validated for.
+            server_id: Discord server ID the token was validated for.
+        """
+        if self.maxsize <= 0:
+            return
+
+        key = self._make_key(token, user_id, server_id)
+        self._entries.pop(key, None)
+        while len(self._entries) >= self.maxsize:
+            self._entries.popitem(last=False)
+        self._entries[key] = time.monotonic() + self.ttl
+
+    def clear(self) -> None:
+        """Remove all cached validations."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _make_key(token: str, user_id: str, server_id: str) -> str:
+        """Build the cache key without keeping the raw token."""
+        digest = hashlib.blake2b(token.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{digest}:{user_id}:{server_id}"
@@ -28,10 +28,11 @@ Warning:
 """
 
 import asyncio
-import json
 import random
 import websockets
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Dict, Any, Optional, TYPE_CHECKING
+
+from .._json import dumps as json_dumps
 
 if TYPE_CHECKING:
     from websockets.server import WebSocketServerProtocol
@@ -83,6 +84,7 @@ class MockDataProvider:
                 Used for accessing server methods like _random_status().
         """
         self.server = server_instance
+        self._server_list_message: Optional[str] = None
 
     def get_mock_user_data(self, discord_server_id: str = None) -> Dict[str, Any]:
         """Get mock user data for a specific Discord server.
@@ -370,6 +372,29 @@ class MockDataProvider:
             }
         }
 
+    def get_mock_server_list_message(self) -> str:
+        """Get the serialized server-list message for the mock servers.
+
+        The mock server data never changes, so the message sent to every new
+        connection is serialized on first use and reused afterwards.
+
+        Returns:
+            str: JSON encoded message of the form
+                {"type": "server-list", "data": {...}} where data is the
+                result of get_mock_server_data().
+
+        Examples:
+
+            provider = MockDataProvider(server)
+            await websocket.send(provider.get_mock_server_list_message())
+        """
+        if self._server_list_message is None:
+            self._server_list_message = json_dumps({
+                "type": "server-list",
+                "data": self.get_mock_server_data()
+            })
+        return self._server_list_message
+
     async def periodic_status_updates(self, websocket: 'WebSocketServerProtocol') -> None:
         """Periodically send mock user status changes to a connected client.
 
@@ -426,7 +451,7 @@ class MockDataProvider:
                     }
                 }
                 print(f"[SEND] presence update for {uid}: {status}")
-                await websocket.send(json.dumps(presence_msg))
+                await websocket.send(json_dumps(presence_msg))
         except websockets.ConnectionClosed:
             print("[INFO] Presence update task stopped: connection closed")
             # Remove closed connections
@@ -501,7 +526,7 @@ class MockDataProvider:
                     }
                 }
                 print(f"[SEND] periodic message from {uid}: {msg_text}")
-                await websocket.send(json.dumps(msg))
+                await websocket.send(json_dumps(msg))
         except websockets.ConnectionClosed:
             print("[INFO] Periodic message task stopped: connection closed")
             # Remove closed connections
@@ -35,16 +35,23 @@ Example:
 """
 import asyncio
 import websockets
-import json
 import traceback
 import random
 import mimetypes
 import argparse
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, Callable, Awaitable, Optional, Tuple
 
+from ._json import dumps as json_dumps, loads as json_loads
+from .auth import TokenCache
 from .mock import MockDataProvider
 
+# Static files up to this size are kept in memory between requests.
+_STATIC_CACHE_MAX_FILE_SIZE = 1024 * 1024
+# Total size of cached static file contents; least recently used files are evicted beyond it.
+_STATIC_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
 
 class WebSocketServer:
     """WebSocket server for managing real-time connections and broadcasting messages.
@@ -64,6 +71,7 @@ class WebSocketServer:
         connections (set): Set of active WebSocket connections.
         static_dir (Path): Directory path for serving static files.
         mock_provider (MockDataProvider): Provider for mock test data.
+        token_cache (TokenCache): Cache of successful Discord OAuth2 validations.
 
     Example:
         Basic usage::
@@ -94,13 +102,18 @@ class WebSocketServer:
             await server.run_forever()
     """
     
-    def __init__(self, port: int = 3000, host: str = "localhost"):
+    def __init__(self, port: int = 3000, host: str = "localhost", reuse_port: bool = False):
         """Initialize the WebSocket server.
 
         Args:
-            port: The port number to listen on. Defaults to 3000.
+            port: The port number to listen on. Defaults to 3000. Use 0 to let the
+                  operating system pick a free port (self.port is updated once bound).
             host: The hostname or IP address to bind to. Defaults to "localhost".
                   Use "0.0.0.0" to accept connections from any interface.
+            reuse_port: Set SO_REUSEPORT on the listening socket so several server
+                  processes can bind the same port and let the kernel spread
+                  incoming connections between them. Defaults to False. Not
+                  supported on Windows.
 
         Note:
             The server initializes with mock data provider by default. Register custom
@@ -109,6 +122,7 @@ class WebSocketServer:
         """
         self.port = port
         self.host = host
+        self.reuse_port = reuse_port
         self.server = None  # WebSocket server instance
         self.connections: set = set()  # Store active connections
         self._on_get_server_data: Optional[Callable[[], Awaitable[Dict[str, Dict[str, Any]]]]] = None
@@ -118,6 +132,12 @@ class WebSocketServer:
         self._on_validate_discord_user: Optional[Callable[[str, Dict[str, Any], str], Awaitable[bool]]] = None
         self._on_get_client_id: Optional[Callable[[str], Awaitable[str]]] = None
         self.mock_provider = MockDataProvider(self)  # Mock data provider
+        self._mock_tasks: set = set()  # Running mock data tasks, cancelled by stop()
+        self.token_cache = TokenCache()  # Successful OAuth2 validations
+        self._static_file_cache: "OrderedDict[Path, Tuple[int, int, bytes]]" = OrderedDict()  # path -> (mtime_ns, size, content)
+        self._static_file_cache_bytes = 0  # Total size of cached file contents
+        self._ready_future: Optional[asyncio.Future] = None  # Done once the server is listening or failed to start
+        self._http_classes: Optional[Tuple[bool, Any, Any, Tuple[int, ...]]] = None  # Detected once, reused per request
     
     async def start(self) -> None:
         """Start the WebSocket server and wait for it to close.
@@ -137,27 +157,107 @@ class WebSocketServer:
             This method blocks until the server is stopped. Use run_forever() for
             a more convenient async context manager approach.
         """
-        self.server = await websockets.serve(
-            self._handler, 
-            self.host, 
-            self.port, 
-            process_request=self._process_request
-        )
+        self._reset_ready()
+        try:
+            self.server = await websockets.serve(
+                self._handler, 
+                self.host, 
+                self.port, 
+                process_request=self._process_request,
+                **self._serve_options()
+            )
+        except BaseException as e:
+            self._mark_failed(e)
+            raise
+        self._mark_ready()
         print(f"WebSocket server started on ws://{self.host}:{self.port}")
         await self.server.wait_closed()
   
+    async def wait_until_ready(self) -> None:
+        """Wait until the server is listening for connections.
+
+        Useful when the server is started as a background task, for example in
+        tests, to avoid sleeping for a fixed amount of time before connecting.
+
+        Returns:
+            None
+
+        Raises:
+            OSError: If the server failed to bind, e.g. because the port is in use.
+            Exception: Any other error that stopped the server before it was ready.
+
+        Examples:
+
+            server = WebSocketServer(port=0, host="127.0.0.1")
+            task = asyncio.create_task(server.run_forever())
+            await server.wait_until_ready()
+            print(f"Listening on port {server.port}")
+        """
+        await asyncio.shield(self._get_ready_future())
+
+    def _get_ready_future(self) -> asyncio.Future:
+        """Get the readiness future, creating it inside the running event loop."""
+        if self._ready_future is None:
+            self._ready_future = asyncio.get_running_loop().create_future()
+        return self._ready_future
+
+    def _mark_ready(self) -> None:
+        """Record the bound port and signal that the server is listening.
+
+        When the server was created with port 0 the operating system picks a free
+        port; self.port is updated to the port that was actually bound.
+        """
+        if self.port == 0 and self.server is not None and self.server.sockets:
+            self.port = self.server.sockets[0].getsockname()[1]
+        ready = self._get_ready_future()
+        if not ready.done():
+            ready.set_result(None)
+
+    def _mark_failed(self, error: BaseException) -> None:
+        """Wake up wait_until_ready() callers when the server stops before it is ready.
+
+        Args:
+            error: The exception that stopped the server. Errors that aren't regular
+                exceptions, like task cancellation, are reported as RuntimeError.
+        """
+        ready = self._get_ready_future()
+        if ready.done():
+            return
+        if not isinstance(error, Exception):
+            error = RuntimeError("Server stopped before it was ready")
+        ready.set_exception(error)
+        # The error is raised to the caller of start()/run_forever() as well, so
+        # don't have asyncio log it again when nobody is waiting for readiness
+        ready.exception()
+
+    def _reset_ready(self) -> None:
+        """Forget the outcome of a previous start so readiness is signaled afresh."""
+        if self._ready_future is not None and self._ready_future.done():
+            self._ready_future = None
+
     async def stop(self) -> None:
         """Gracefully stop the WebSocket server.
 
-        This method closes the server and waits for all existing connections to terminate.
-        Active connections are allowed to finish their current operations before shutdown.
+        This method cancels the mock data tasks, closes the server and waits for all
+        existing connections to terminate. Active connections are allowed to finish
+        their current operations before shutdown.
 
         Returns:
             None
 
         Note:
             After calling this method, the server can be restarted by calling start() again.
+            A run_forever() task returns once the server is closed.
         """
+        # Wake up anyone still waiting for readiness, then let a restarted server
+        # become ready again
+        if self._ready_future is not None and not self._ready_future.done():
+            self._mark_failed(RuntimeError("Server stopped"))
+        self._ready_future = None
+        # Cancel mock data tasks so none are left pending once the loop shuts down
+        for task in self._mock_tasks:
+            task.cancel()
+        await asyncio.gather(*self._mock_tasks, return_exceptions=True)
         if self.server:
             self.server.close()
             await self.server.wait_closed()
@@ -179,9 +279,9 @@ class WebSocketServer:
         Returns:
             None
 
-        Raises:
-            websockets.ConnectionClosed: When attempting to send to a closed connection
-                (handled internally, connection is removed).
+        Note:
+            Connections that are closed or closing are skipped. They are removed
+            from the connection set by the connection handler once they disconnect.
 
         Examples:
 
@@ -212,20 +312,21 @@ class WebSocketServer:
 
         print(f"[BROADCAST] Sending message to {len(server_connections)} connections on server {server}: {message}")
         
-        # Create a copy to avoid modification during iteration
-        connections_copy = server_connections.copy()
-        
-        for websocket in connections_copy:
-            try:
-                await websocket.send(json.dumps(msg))
-            except websockets.ConnectionClosed:
-                print("[INFO] Removed closed connection during broadcast")
-                # Remove closed connections
-                self.connections.discard(websocket)
-            except Exception as e:
-                print(f"[ERROR] Failed to send message to connection: {e}")
-                # Optionally remove problematic connections
-                self.connections.discard(websocket)
+        self._broadcast(server_connections, msg)
+
+    def _broadcast(self, server_connections: list, msg: Dict[str, Any]) -> None:
+        """Serialize a message once and push it to the given connections.
+
+        Uses websockets.broadcast() so the JSON payload is encoded a single time and
+        written to every connection without awaiting each send individually.
+        Connections that aren't open are skipped and write failures on one
+        connection don't prevent delivery to the others.
+
+        Args:
+            server_connections: WebSocket connections to send the message to.
+            msg: Message dictionary to serialize and send.
+        """
+        websockets.broadcast(server_connections, json_dumps(msg))
 
     def on_get_server_data(self, callback: Callable[[], Awaitable[Dict[str, Dict[str, Any]]]]) -> None:
         """Register a callback to provide server configuration data.
@@ -386,9 +487,19 @@ class WebSocketServer:
             await server.run_forever()  # Runs until interrupted
 
         Note:
-            This method runs indefinitely until interrupted. Use asyncio.create_task()
-            if you need to run other async operations concurrently.
+            This method runs until interrupted or until stop() closes the server.
+            Use asyncio.create_task() if you need to run other async operations
+            concurrently.
         """
+        self._reset_ready()
+        try:
+            await self._serve_forever()
+        except BaseException as e:
+            self._mark_failed(e)
+            raise
+
+    async def _serve_forever(self) -> None:
+        """Serve with HTTP support if the websockets version allows it, else WebSocket-only."""
         # For Python 3.8+ compatibility, start with WebSocket-only mode
         # and only try HTTP if we're confident it will work
         has_http_support = False
@@ -429,10 +540,13 @@ class WebSocketServer:
                     self._handler, 
                     self.host, 
                     self.port, 
-                    process_request=self._process_request
-                ):
+                    process_request=self._process_request,
+                    **self._serve_options()
+                ) as self.server:
+                    self._mark_ready()
                     print(f"Mock WebSocket server running on ws://{self.host}:{self.port} (with HTTP support)")
-                    await asyncio.Future()  # run forever
+                    await self.server.wait_closed()  # run until stop() closes the server
+                    return
             except Exception as e:
                 print(f"[WARNING] Failed to start with HTTP support: {e}")
                 print("[INFO] Falling back to WebSocket-only mode")
@@ -442,10 +556,19 @@ class WebSocketServer:
             async with websockets.serve(
                 self._handler, 
                 self.host, 
-                self.port
-            ):
+                self.port,
+                **self._serve_options()
+            ) as self.server:
+                self._mark_ready()
                 print(f"Mock WebSocket server running on ws://{self.host}:{self.port} (WebSocket-only mode)")
-                await asyncio.Future()  # run forever
+                await self.server.wait_closed()  # run until stop() closes the server
+
+    def _serve_options(self) -> Dict[str, Any]:
+        """Get extra keyword arguments passed through websockets.serve() to the event loop."""
+        options: Dict[str, Any] = {}
+        if self.reuse_port:
+            options["reuse_port"] = True
+        return options
 
     def _random_color(self) -> str:
         """Generate a random color hex code."""
@@ -457,6 +580,19 @@ class WebSocketServer:
 
     def _get_http_classes(self):
         """Get HTTP classes for websockets compatibility.
+
+        The installed websockets version cannot change while the server runs, so
+        detection happens on the first HTTP request and the result is reused.
+        
+        Returns:
+            tuple: (use_new_http: bool, Response, Headers, websockets_version) 
+        """
+        if self._http_classes is None:
+            self._http_classes = self._detect_http_classes()
+        return self._http_classes
+
+    def _detect_http_classes(self):
+        """Detect the HTTP classes available in the installed websockets version.
         
         Returns:
             tuple: (use_new_http: bool, Response, Headers, websockets_version) 
@@ -721,10 +857,10 @@ class WebSocketServer:
                     file_path = Path(file_path).resolve()
                     # Check if file exists
                     if not file_path.exists() or not file_path.is_file():
+                        self._evict_static_file(file_path)
                         return self._create_http_response(404, "Not Found", "text/html", b"<h1>404 Not Found</h1><p>The requested file was not found.</p>", use_new_http, Response, Headers, websockets_version)
                     
-                    with open(file_path, "rb") as f:
-                        content = f.read()
+                    content = self._read_static_file(file_path)
                         
                     return self._create_http_response(200, "OK", content_type, content, use_new_http, Response, Headers, websockets_version)
             
@@ -737,31 +873,24 @@ class WebSocketServer:
             if clean_path == "/" or clean_path == "":
                 clean_path = "/index.html"
             
-            # Remove leading slash and resolve file path
-            file_path = self.static_dir / clean_path.lstrip("/")
-            
-            # Security check - ensure we're not serving files outside static_dir
-            try:
-                file_path = file_path.resolve()
-                self.static_dir.resolve()
-                if not str(file_path).startswith(str(self.static_dir.resolve())):
-                    return self._create_http_response(403, "Forbidden", "text/plain", b"Forbidden", use_new_http, Response, Headers, websockets_version)
-            except (OSError, ValueError):
+            # Resolve file path (includes the security check against serving files outside static_dir)
+            file_path = self._resolve_static_path(clean_path)
+            if file_path is None:
                 return self._create_http_response(403, "Forbidden", "text/plain", b"Forbidden", use_new_http, Response, Headers, websockets_version)
             
             # Check if file exists
-            if not file_path.exists() or not file_path.is_file():
+            if not file_path.is_file():
+                self._evict_static_file(file_path)
                 return self._create_http_response(404, "Not Found", "text/html", b"<h1>404 Not Found</h1><p>The requested file was not found.</p>", use_new_http, Response, Headers, websockets_version)
             
+            # Read and return file
+            content = self._read_static_file(file_path)
+            
             # Determine content type
             content_type, _ = mimetypes.guess_type(str(file_path))
             if content_type is None:
                 content_type = "application/octet-stream"
             
-            # Read and return file
-            with open(file_path, "rb") as f:
-                content = f.read()
-            
             return self._create_http_response(200, "OK", content_type, content, use_new_http, Response, Headers, websockets_version)
             
         except Exception as e:
@@ -771,11 +900,85 @@ class WebSocketServer:
             use_new_http, Response, Headers, websockets_version = self._get_http_classes()
             return self._create_http_response(500, "Internal Server Error", "text/plain", b"Internal Server Error", use_new_http, Response, Headers, websockets_version)
 
+    def _resolve_static_path(self, clean_path: str) -> Optional[Path]:
+        """Resolve a request path to a file in the static directory.
+
+        The path is resolved and checked against the static directory on every
+        request, since a file inside it can be replaced by a symlink pointing
+        elsewhere at any time.
+
+        Args:
+            clean_path: Request path without query parameters, e.g. "/index.html".
+
+        Returns:
+            Path: The resolved file path, or None if the path points outside the
+                static directory.
+        """
+        # Remove leading slash and resolve file path
+        file_path = self.static_dir / clean_path.lstrip("/")
+        
+        # Security check - ensure we're not serving files outside static_dir
+        try:
+            file_path = file_path.resolve()
+        except (OSError, ValueError):
+            return None
+        if not str(file_path).startswith(str(self.static_dir.resolve())):
+            return None
+        return file_path
+
+    def _read_static_file(self, file_path: Path) -> bytes:
+        """Read a static file, reusing the cached contents while it is unchanged.
+
+        The websockets HTTP response needs the full body as bytes, so files can't be
+        streamed with sendfile(). Instead, file contents are kept in memory and only
+        re-read from disk when the file's modification time or size changes. Files
+        larger than _STATIC_CACHE_MAX_FILE_SIZE are read on every request, and the
+        least recently used files are evicted once the cached contents exceed
+        _STATIC_CACHE_MAX_BYTES.
+
+        Args:
+            file_path: Resolved path of the file to read.
+
+        Returns:
+            bytes: The file contents.
+
+        Raises:
+            FileNotFoundError: If the file no longer exists. Its cache entry is dropped.
+        """
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            self._evict_static_file(file_path)
+            raise
+
+        cached = self._static_file_cache.get(file_path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            self._static_file_cache.move_to_end(file_path)
+            return cached[2]
+
+        with open(file_path, "rb") as f:
+            content = f.read()
+
+        self._evict_static_file(file_path)
+        if len(content) <= _STATIC_CACHE_MAX_FILE_SIZE:
+            self._static_file_cache[file_path] = (stat.st_mtime_ns, stat.st_size, content)
+            self._static_file_cache_bytes += len(content)
+            while self._static_file_cache_bytes > _STATIC_CACHE_MAX_BYTES:
+                _, (_, _, evicted) = self._static_file_cache.popitem(last=False)
+                self._static_file_cache_bytes -= len(evicted)
+        return content
+
+    def _evict_static_file(self, file_path: Path) -> None:
+        """Remove a file from the static file cache if it is cached."""
+        cached = self._static_file_cache.pop(file_path, None)
+        if cached is not None:
+            self._static_file_cache_bytes -= len(cached[2])
+
     async def _serve_version_api(self):
         """Serve package version information as JSON API endpoint.
 
         Handles GET requests to /api/version and returns the current package
-        version in JSON format.
+        version in JSON format. The response body is precomputed at import time.
 
         Returns:
             Response: HTTP response with JSON containing {"version": "x.y.z"}
@@ -787,14 +990,7 @@ class WebSocketServer:
             # Get HTTP classes for compatibility
             use_new_http, Response, Headers, websockets_version = self._get_http_classes()
             
-            try:
-                from . import __version__
-                version_data = {"version": __version__}
-            except ImportError as e:
-                print(f"[WARNING] Could not import version: {e}")
-                version_data = {"version": "unknown"}
-            
-            return self._create_http_response(200, "OK", "application/json", json.dumps(version_data).encode(), use_new_http, Response, Headers, websockets_version)
+            return self._create_http_response(200, "OK", "application/json", _VERSION_API_BODY, use_new_http, Response, Headers, websockets_version)
         
         except Exception as e:
             print(f"[ERROR] Failed to serve version API: {e}")
@@ -830,14 +1026,15 @@ class WebSocketServer:
             
             if self._on_get_server_data:
                 server_data = await self._on_get_server_data()
+                server_list_message = json_dumps({
+                    "type": "server-list",
+                    "data": server_data
+                })
             else:
-                # simulate getting server data
-                server_data = self.mock_provider.get_mock_server_data()
+                # simulate getting server data (mock data is static, so reuse the serialized message)
+                server_list_message = self.mock_provider.get_mock_server_list_message()
 
-            await websocket.send(json.dumps({
-                "type": "server-list",
-                "data": server_data
-            }))
+            await websocket.send(server_list_message)
             
             # Wait for messages from client
             async for message in websocket:
@@ -849,25 +1046,25 @@ class WebSocketServer:
                     except Exception as e:
                         print(f"[ERROR] Failed to decode binary message: {e}")
                         traceback.print_exc()
-                        await websocket.send(json.dumps({"type": "error", "data": {"message": "Invalid binary encoding"}}))
+                        await websocket.send(json_dumps({"type": "error", "data": {"message": "Invalid binary encoding"}}))
                         continue
                 else:
                     print(f"[RECV] Raw message: {message}")
                 
                 try:
-                    data = json.loads(message)
+                    data = json_loads(message)
                     print(f"[PARSE] Parsed message: {data}")
                 except Exception as e:
                     print(f"[ERROR] Failed to parse JSON: {e}")
                     traceback.print_exc()
-                    await websocket.send(json.dumps({"type": "error", "data": {"message": "Invalid JSON"}}))
+                    await websocket.send(json_dumps({"type": "error", "data": {"message": "Invalid JSON"}}))
                     continue
                 
                 if data.get("type") == "connect":
                     await self._handle_connect(websocket, data)
                 else:
                     print(f"[ERROR] Unknown event type: {data.get('type')}")
-                    await websocket.send(json.dumps({"type": "error", "data": {"message": "Unknown event type"}}))
+                    await websocket.send(json_dumps({"type": "error", "data": {"message": "Unknown event type"}}))
                     
         except websockets.ConnectionClosed as e:
             print(f"[DISCONNECT] Client disconnected: {e}")
@@ -964,7 +1161,7 @@ class WebSocketServer:
             print(f"[ERROR] Available server IDs in data: {available_ids}")
             print(f"[ERROR] Servers with default=True: {default_servers if default_servers else 'NONE'}")
             print(f"[ERROR] Total servers checked: {len(server_data)}")
-            await websocket.send(json.dumps({
+            await websocket.send(json_dumps({
                 "type": "error", 
                 "data": {"message": "Sorry, couldn't connect to that Discord server."}
             }))
@@ -980,7 +1177,7 @@ class WebSocketServer:
                 auth_valid = await self._validate_discord_oauth(discord_token, discord_user, discord_server_id)
                 if not auth_valid:
                     print(f"[ERROR] Discord OAuth2 validation failed for server {server_id}")
-                    await websocket.send(json.dumps({
+                    await websocket.send(json_dumps({
                         "type": "error", 
                         "data": {"message": "Discord authentication failed. Please try logging in again."}
                     }))
@@ -997,7 +1194,7 @@ class WebSocketServer:
                 print(f"[DEBUG] discord_token present: {bool(discord_token)}")
                 print(f"[DEBUG] discord_user present: {bool(discord_user)}")
                 print(f"[DEBUG] password present: {bool(password)}")
-                await websocket.send(json.dumps({
+                await websocket.send(json_dumps({
                     "type": "error", 
                     "data": {"message": "This server requires Discord authentication. Please login with Discord."}
                 }))
@@ -1040,7 +1237,7 @@ class WebSocketServer:
         if client_id:
             response_data["clientId"] = client_id
             
-        await websocket.send(json.dumps({
+        await websocket.send(json_dumps({
             "type": "server-join",
             "data": response_data
         }))
@@ -1048,14 +1245,19 @@ class WebSocketServer:
         # Only start mock data if using mock data (not when using real callbacks)
         if not self._on_get_user_data and not self._on_get_server_data:
             # Start background tasks for mock data
-            asyncio.create_task(self.mock_provider.periodic_messages(websocket))
-            asyncio.create_task(self.mock_provider.periodic_status_updates(websocket))
+            for coro in (self.mock_provider.periodic_messages(websocket),
+                         self.mock_provider.periodic_status_updates(websocket)):
+                task = asyncio.create_task(coro)
+                self._mock_tasks.add(task)
+                task.add_done_callback(self._mock_tasks.discard)
 
     async def _validate_discord_oauth(self, token: str, user_info: Dict[str, Any], discord_server_id: str) -> bool:
         """Validate Discord OAuth2 token and verify user server membership.
 
         Checks OAuth2 token validity and user information. Uses custom validation
         callback if registered, otherwise provides mock validation for testing.
+        Successful callback validations are kept in self.token_cache so repeated
+        connections with the same token skip the callback until the entry expires.
 
         Args:
             token: Discord OAuth2 access token
@@ -1089,7 +1291,16 @@ class WebSocketServer:
                 
             # If we have callbacks (real Discord bot), we can validate the user
             if self._on_validate_discord_user:
-                return await self._on_validate_discord_user(token, user_info, discord_server_id)
+                user_id = str(user_info.get('id'))
+                if self.token_cache.is_validated(token, user_id, discord_server_id):
+                    print(f"[AUTH] Using cached validation for user {user_info.get('username')} ({user_id})")
+                    return True
+                
+                is_valid = await self._on_validate_discord_user(token, user_info, discord_server_id)
+                # Only cache successful validations so failures are retried
+                if is_valid:
+                    self.token_cache.mark_validated(token, user_id, discord_server_id)
+                return is_valid
             
             # For other mock/testing purposes, accept any valid-looking token and user
             print(f"[AUTH] Mock validation: accepting user {user_info.get('username')} ({user_info.get('id')})")
@@ -1163,20 +1374,7 @@ class WebSocketServer:
 
         print(f"[BROADCAST] Sending presence update to {len(server_connections)} connections on server {server}: {uid} -> {status}")
         
-        # Create a copy to avoid modification during iteration
-        connections_copy = server_connections.copy()
-        
-        for websocket in connections_copy:
-            try:
-                await websocket.send(json.dumps(msg))
-            except websockets.ConnectionClosed:
-                print("[INFO] Removed closed connection during presence broadcast")
-                # Remove closed connections
-                self.connections.discard(websocket)
-            except Exception as e:
-                print(f"[ERROR] Failed to send presence update to connection: {e}")
-                # Optionally remove problematic connections
-                self.connections.discard(websocket)
+        self._broadcast(server_connections, msg)
 
     async def broadcast_client_id_update(self, server: str, client_id: str) -> None:
         """Broadcast an OAuth2 client ID update to all clients connected to a server.
@@ -1217,20 +1415,7 @@ class WebSocketServer:
 
         print(f"[BROADCAST] Sending client ID update to {len(server_connections)} connections on server {server}: {client_id}")
         
-        # Create a copy to avoid modification during iteration
-        connections_copy = server_connections.copy()
-        
-        for websocket in connections_copy:
-            try:
-                await websocket.send(json.dumps(msg))
-            except websockets.ConnectionClosed:
-                print("[INFO] Removed closed connection during client ID broadcast")
-                # Remove closed connections
-                self.connections.discard(websocket)
-            except Exception as e:
-                print(f"[ERROR] Failed to send client ID update to connection: {e}")
-                # Optionally remove problematic connections
-                self.connections.discard(websocket)
+        self._broadcast(server_connections, msg)
 
 
 def parse_args():
@@ -1244,6 +1429,7 @@ def parse_args():
             - port (int): Server port number (default: 3000)
             - host (str): Server hostname (default: 'localhost')
             - static_dir (str): Custom static files directory (default: None)
+            - reuse_port (bool): Whether to set SO_REUSEPORT (default: False)
 
     Examples:
 
@@ -1273,6 +1459,11 @@ def parse_args():
         default=None,
         help='Directory to serve static files from (default: built-in dist directory)'
     )
+    parser.add_argument(
+        '--reuse-port',
+        action='store_true',
+        help='Set SO_REUSEPORT so several server processes can share the port (not supported on Windows)'
+    )
     parser.add_argument(
         '--version',
         action='version',
@@ -1300,6 +1491,10 @@ def get_version():
     except ImportError:
         return "unknown"
 
+# The package version can't change while the process is running, so the
+# /api/version response body is serialized once at import time.
+_VERSION_API_BODY = json_dumps({"version": get_version()}).encode()
+
 async def main():
     """Main async entry point for the D-Back WebSocket server.
 
@@ -1334,7 +1529,7 @@ async def main():
     print(f"Host: {args.host}")
     print(f"Port: {args.port}")
     
-    server = WebSocketServer(port=args.port, host=args.host)
+    server = WebSocketServer(port=args.port, host=args.host, reuse_port=args.reuse_port)
     
     # Set custom static directory if provided
     if args.static_dir:
@@ -1350,11 +1545,32 @@ async def main():
     
     await server.run_forever()
 
+def _run_main() -> None:
+    """Run main() on uvloop when it is installed, otherwise on the default asyncio loop.
+
+    uvloop is an optional dependency (``pip install d-back[fast]``, not available
+    on Windows). uvloop.run() is used as the loop factory for this run only, so
+    the process-wide event loop policy is left untouched.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        uvloop = None
+
+    # uvloop.run() needs uvloop 0.18 or newer
+    if uvloop is None or not hasattr(uvloop, "run"):
+        asyncio.run(main())
+        return
+
+    print(f"[INFO] Using uvloop {uvloop.__version__} event loop")
+    uvloop.run(main())
+
 def main_sync():
     """Synchronous entry point wrapper for the D-Back WebSocket server.
 
-    Wraps the async main() function in asyncio.run() to provide a synchronous
-    entry point. Handles KeyboardInterrupt gracefully for clean server shutdown.
+    Runs the async main() function to completion to provide a synchronous
+    entry point. Uses uvloop for the event loop when it is installed. Handles
+    KeyboardInterrupt gracefully for clean server shutdown.
 
     Returns:
         None
@@ -1369,7 +1585,7 @@ def main_sync():
         console_scripts. It ensures proper async context management.
     """
     try:
-        asyncio.run(main())
+        _run_main()
     except KeyboardInterrupt:
         print("\n[INFO] Server stopped by user")
 
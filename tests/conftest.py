@@ -0,0 +1,65 @@
+"""
+Shared fixtures for the d_back test suite.
+"""
+
+import socket
+import subprocess
+import sys
+import time
+
+import pytest
+
+
+def wait_for_server(server_proc, host="localhost", port=3000, timeout=10.0):
+    """Wait until the server accepts TCP connections instead of sleeping a fixed time."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server_proc.poll() is not None:
+            raise RuntimeError(f"Server exited with code {server_proc.returncode} before accepting connections")
+        try:
+            with socket.create_connection((host, port), timeout=0.1):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise TimeoutError(f"Server did not accept connections on {host}:{port} within {timeout}s")
+
+
+@pytest.fixture(scope="session")
+def server_log(tmp_path_factory):
+    """Path of the file collecting the output of the d_back server.
+
+    Read it with server_log.read_text(). That opens a separate file handle, so
+    reading never moves the offset the running server writes at.
+    """
+    return tmp_path_factory.mktemp("d_back_server") / "server.log"
+
+
+@pytest.fixture(scope="session")
+def server_process(server_log):
+    """Start one d_back server on localhost:3000 shared by every test in the session."""
+    # Output goes to a file rather than a pipe, so a chatty server can never
+    # block on a full pipe buffer
+    with open(server_log, "w") as log:
+        server_proc = subprocess.Popen(
+            [sys.executable, "-m", "d_back"],
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            text=True
+        )
+    try:
+        wait_for_server(server_proc)
+    except Exception as e:
+        server_proc.kill()
+        server_proc.wait()
+        raise RuntimeError(f"Server failed to start: {e}. output: {server_log.read_text()}") from e
+
+    yield server_proc
+
+    # Cleanup with proper timeout handling
+    if server_proc.poll() is None:
+        server_proc.terminate()
+        try:
+            server_proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            server_proc.kill()
+            server_proc.wait(timeout=2)
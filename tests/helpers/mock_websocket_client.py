@@ -3,6 +3,12 @@ import websockets
 import json
 
 ADDRESS = "ws://localhost:3000"
+RECV_TIMEOUT = 10  # seconds for all follow-up messages together
+
+async def log_messages(ws, count):
+    for _ in range(count):
+        msg = await ws.recv()
+        print(f"[RECV] {msg}", flush=True)
 
 async def log_communication():
     async with websockets.connect(ADDRESS) as ws:
@@ -17,11 +23,11 @@ async def log_communication():
         }
         print(f"[SEND] {json.dumps(connect_msg)}", flush=True)
         await ws.send(json.dumps(connect_msg))
-        # Log next 3 messages then exit
+        # Log next 3 messages then exit, giving up after one shared deadline
         try:
-            for _ in range(3):
-                msg = await ws.recv()
-                print(f"[RECV] {msg}", flush=True)
+            await asyncio.wait_for(log_messages(ws, 3), timeout=RECV_TIMEOUT)
+        except asyncio.TimeoutError:
+            print(f"Timed out after {RECV_TIMEOUT}s waiting for messages.", flush=True)
         except websockets.ConnectionClosed:
             print("Connection closed by server.", flush=True)
         except Exception as e:
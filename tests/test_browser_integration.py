@@ -4,7 +4,6 @@ Tests the d_back server's web interface functionality.
 """
 
 import os
-import subprocess
 import sys
 import time
 import pytest
@@ -16,6 +15,7 @@ try:
     from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.chrome.options import Options
     from selenium.common.exceptions import TimeoutException, WebDriverException
+    from selenium.webdriver.chrome.service import Service
     SELENIUM_AVAILABLE = True
     
     # Try to import webdriver-manager for automatic driver management
@@ -35,6 +35,11 @@ try:
 except ImportError:
     ALLURE_AVAILABLE = False
 
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
 
 def get_websockets_version():
     """Get websockets version from environment or actual package."""
@@ -44,11 +49,9 @@ def get_websockets_version():
         return env_version
     
     # Fallback to checking actual installed version
-    try:
-        import websockets
-        return websockets.version
-    except ImportError:
+    if websockets is None:
         return "unknown"
+    return websockets.version
 
 
 def get_python_version():
@@ -59,7 +62,6 @@ def get_python_version():
         return env_version
     
     # Fallback to actual Python version
-    import sys
     return f"{sys.version_info.major}.{sys.version_info.minor}"
 
 
@@ -123,39 +125,6 @@ def _apply_allure_decorators_styling(func):
 class TestBrowserIntegration:
     """Browser integration tests for d_back server."""
     
-    @pytest.fixture(scope="class")
-    def server_process(self):
-        """Start the d_back server for testing."""
-        server_proc = subprocess.Popen(
-            [sys.executable, "-m", "d_back"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1
-        )
-        
-        # Give server more time to start for browser tests
-        time.sleep(3)
-        
-        # Verify server is still running
-        if server_proc.poll() is not None:
-            stdout, stderr = server_proc.communicate()
-            raise RuntimeError(f"Server failed to start. stdout: {stdout}, stderr: {stderr}")
-        
-        yield server_proc
-        
-        # Cleanup with proper timeout handling
-        if server_proc.poll() is None:
-            server_proc.terminate()
-            try:
-                server_proc.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                server_proc.kill()
-                try:
-                    server_proc.wait(timeout=2)
-                except subprocess.TimeoutExpired:
-                    pass
-
     @pytest.fixture(scope="class")
     def chrome_driver(self):
         """Setup headless Chrome driver."""
@@ -176,8 +145,6 @@ class TestBrowserIntegration:
         try:
             # Try to create the driver with webdriver-manager if available
             if WEBDRIVER_MANAGER_AVAILABLE:
-                from webdriver_manager.chrome import ChromeDriverManager
-                from selenium.webdriver.chrome.service import Service
                 service = Service(ChromeDriverManager().install())
                 driver = webdriver.Chrome(service=service, options=chrome_options)
             else:
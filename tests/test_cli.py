@@ -0,0 +1,39 @@
+"""
+Tests for the d_back command line entry point.
+"""
+
+import asyncio
+import sys
+
+from d_back import server as server_module
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def test_main_sync_leaves_event_loop_policy_alone(monkeypatch):
+    policy = asyncio.get_event_loop_policy()
+    loop_modules = []
+
+    async def fake_main():
+        loop_modules.append(type(asyncio.get_running_loop()).__module__)
+
+    monkeypatch.setattr(server_module, "main", fake_main)
+    server_module.main_sync()
+
+    assert len(loop_modules) == 1
+    if uvloop is not None and hasattr(uvloop, "run"):
+        assert loop_modules[0].startswith("uvloop")
+    assert asyncio.get_event_loop_policy() is policy
+
+
+def test_parse_args_reuse_port(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["d_back"])
+    assert server_module.parse_args().reuse_port is False
+
+    monkeypatch.setattr(sys, "argv", ["d_back", "--port", "3001", "--reuse-port"])
+    args = server_module.parse_args()
+    assert args.reuse_port is True
+    assert args.port == 3001
@@ -0,0 +1,101 @@
+"""
+Tests for static file serving and its caches.
+"""
+
+import os
+
+import pytest
+
+from d_back import server as server_module
+from d_back.server import WebSocketServer
+
+
+def _status_and_body(response):
+    """Get (status code, body) from a Response object or a websockets <= 13 tuple."""
+    if isinstance(response, tuple):
+        return int(response[0]), response[2]
+    return response.status_code, response.body
+
+
+def _make_server(static_dir):
+    server = WebSocketServer()
+    server.static_dir = static_dir
+    return server
+
+
+async def test_static_file_is_reread_after_change(tmp_path):
+    page = tmp_path / "a.txt"
+    page.write_bytes(b"first")
+    server = _make_server(tmp_path)
+
+    assert _status_and_body(await server._serve_static_file("/a.txt")) == (200, b"first")
+
+    # Same size, newer modification time
+    page.write_bytes(b"other")
+    mtime_ns = page.stat().st_mtime_ns + 1_000_000_000
+    os.utime(page, ns=(mtime_ns, mtime_ns))
+    assert _status_and_body(await server._serve_static_file("/a.txt")) == (200, b"other")
+
+    # Different size
+    page.write_bytes(b"much longer content")
+    assert _status_and_body(await server._serve_static_file("/a.txt")) == (200, b"much longer content")
+
+
+async def test_deleted_static_file_is_not_found_and_evicted(tmp_path):
+    page = tmp_path / "a.txt"
+    page.write_bytes(b"content")
+    server = _make_server(tmp_path)
+
+    assert _status_and_body(await server._serve_static_file("/a.txt"))[0] == 200
+    assert len(server._static_file_cache) == 1
+
+    page.unlink()
+    assert _status_and_body(await server._serve_static_file("/a.txt"))[0] == 404
+    assert len(server._static_file_cache) == 0
+    assert server._static_file_cache_bytes == 0
+
+
+async def test_static_file_cache_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(server_module, "_STATIC_CACHE_MAX_BYTES", 10)
+    for name in ("a", "b", "c"):
+        (tmp_path / f"{name}.txt").write_bytes(b"four")
+    server = _make_server(tmp_path)
+
+    await server._serve_static_file("/a.txt")
+    await server._serve_static_file("/b.txt")
+    await server._serve_static_file("/a.txt")  # a is now the most recently used
+    await server._serve_static_file("/c.txt")
+
+    cached = {path.name for path in server._static_file_cache}
+    assert cached == {"a.txt", "c.txt"}
+    assert server._static_file_cache_bytes == 8
+
+
+async def test_traversal_outside_static_dir_is_forbidden(tmp_path):
+    static_dir = tmp_path / "static"
+    static_dir.mkdir()
+    (tmp_path / "secret.txt").write_bytes(b"secret")
+    server = _make_server(static_dir)
+
+    for _ in range(2):  # the second request must not be answered from a cache
+        assert _status_and_body(await server._serve_static_file("/../secret.txt")) == (403, b"Forbidden")
+
+
+async def test_file_swapped_for_outside_symlink_is_forbidden(tmp_path):
+    static_dir = tmp_path / "static"
+    static_dir.mkdir()
+    page = static_dir / "a.txt"
+    page.write_bytes(b"public")
+    secret = tmp_path / "secret.txt"
+    secret.write_bytes(b"secret")
+    server = _make_server(static_dir)
+
+    assert _status_and_body(await server._serve_static_file("/a.txt")) == (200, b"public")
+
+    page.unlink()
+    try:
+        page.symlink_to(secret)
+    except OSError:
+        pytest.skip("Symlinks are not supported here")
+    assert _status_and_body(await server._serve_static_file("/a.txt")) == (403, b"Forbidden")
+
@@ -0,0 +1,61 @@
+"""
+Tests for caching of Discord OAuth2 validations.
+"""
+
+from d_back.auth import TokenCache
+from d_back.auth import token_cache
+from d_back.server import WebSocketServer
+
+
+USER = {"id": "323456789012345001", "username": "NNTin"}
+SERVER_ID = "232769614004748288"
+
+
+def test_cached_validation_is_scoped_to_user_and_server():
+    cache = TokenCache()
+    cache.mark_validated("token", USER["id"], SERVER_ID)
+
+    assert cache.is_validated("token", USER["id"], SERVER_ID)
+    assert not cache.is_validated("token", USER["id"], "482241773318701056")
+    assert not cache.is_validated("token", "423456789012345001", SERVER_ID)
+    assert not cache.is_validated("other-token", USER["id"], SERVER_ID)
+
+
+def test_cached_validation_expires(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(token_cache.time, "monotonic", lambda: now[0])
+    cache = TokenCache(ttl=300)
+    cache.mark_validated("token", USER["id"], SERVER_ID)
+
+    now[0] += 299
+    assert cache.is_validated("token", USER["id"], SERVER_ID)
+    now[0] += 1
+    assert not cache.is_validated("token", USER["id"], SERVER_ID)
+    assert len(cache) == 0
+
+
+def test_oldest_validation_is_evicted_when_full():
+    cache = TokenCache(maxsize=2)
+    for token in ("first", "second", "third"):
+        cache.mark_validated(token, USER["id"], SERVER_ID)
+
+    assert len(cache) == 2
+    assert not cache.is_validated("first", USER["id"], SERVER_ID)
+    assert cache.is_validated("third", USER["id"], SERVER_ID)
+
+
+async def test_server_only_caches_successful_validations():
+    server = WebSocketServer()
+    calls = []
+    results = [False, True]
+
+    async def validate(token, user_info, server_id):
+        calls.append(token)
+        return results[len(calls) - 1]
+
+    server.on_validate_discord_user(validate)
+
+    assert not await server._validate_discord_oauth("token", USER, SERVER_ID)
+    assert await server._validate_discord_oauth("token", USER, SERVER_ID)
+    assert await server._validate_discord_oauth("token", USER, SERVER_ID)
+    assert len(calls) == 2
@@ -1,8 +1,16 @@
+import asyncio
+import json
+import socket
 import subprocess
 import sys
-import time
+import threading
 import os
 
+import pytest
+import websockets
+
+from d_back.server import WebSocketServer
+
 try:
     import allure
     ALLURE_AVAILABLE = True
@@ -18,11 +26,7 @@ def get_websockets_version():
         return env_version
     
     # Fallback to checking actual installed version
-    try:
-        import websockets
-        return websockets.version
-    except ImportError:
-        return "unknown"
+    return websockets.version
 
 
 def get_python_version():
@@ -33,7 +37,6 @@ def get_python_version():
         return env_version
     
     # Fallback to actual Python version
-    import sys
     return f"{sys.version_info.major}.{sys.version_info.minor}"
 
 
@@ -58,62 +61,221 @@ def setup_allure_test_info():
                  "Test Configuration", allure.attachment_type.TEXT)
 
 
-def _apply_allure_decorators(func):
-    """Apply allure decorators if available."""
-    if ALLURE_AVAILABLE:
-        func = allure.feature("WebSocket Server")(func)
-        func = allure.story("Server-Client Communication")(func)
-        func = allure.title("Test WebSocket server and client communication")(func)
-    return func
+def _apply_allure_decorators(feature, story, title):
+    """Build a decorator that applies allure feature, story and title if available."""
+    def decorator(func):
+        if ALLURE_AVAILABLE:
+            func = allure.feature(feature)(func)
+            func = allure.story(story)(func)
+            func = allure.title(title)(func)
+        return func
+    return decorator
 
 
-@_apply_allure_decorators
-def test_server_and_client_communication():
+@_apply_allure_decorators(
+    "WebSocket Server", "Server-Client Communication", "Test WebSocket server and client communication"
+)
+def test_server_and_client_communication(server_process, server_log):
     setup_allure_test_info()
     
-    # Start the server using module execution
-    server_proc = subprocess.Popen(
-        [sys.executable, "-m", "d_back"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1  # line buffered
-    )
-    time.sleep(1)  # Give server more time to start
-
     # Start the client and capture output
     client_proc = subprocess.Popen(
         [sys.executable, os.path.join("helpers", "mock_websocket_client.py")],
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
         cwd=os.path.dirname(__file__),  # Ensure working directory is tests/
         text=True
     )
+    # Kill a stalled client after 10s; that closes its stdout and ends the read loop
+    watchdog = threading.Timer(10, client_proc.kill)
+    watchdog.start()
     try:
-        client_stdout, client_stderr = client_proc.communicate(timeout=10)
-        output = client_stdout
+        # Read the client's output as it arrives and stop as soon as every expected
+        # line has shown up instead of waiting for the client to exit
+        missing = {"Connected to ws://localhost:3000", "[RECV]", "[SEND]"}
+        output_lines = []
+        for line in client_proc.stdout:
+            output_lines.append(line)
+            missing = {marker for marker in missing if marker not in line}
+            if not missing:
+                break
+        watchdog.cancel()
+        output = "".join(output_lines)
         
         if ALLURE_AVAILABLE:
             allure.attach(output, "Client Output", allure.attachment_type.TEXT)
-            if client_stderr:
-                allure.attach(client_stderr, "Client Errors", allure.attachment_type.TEXT)
         
         if not output:
             # Print diagnostic info if output is empty
-            server_out, server_err = server_proc.communicate(timeout=2)
-            print("SERVER STDOUT:\n", server_out)
-            print("SERVER STDERR:\n", server_err)
-            print("CLIENT STDERR:\n", client_stderr)
+            server_out = server_log.read_text()
+            print("SERVER OUTPUT:\n", server_out)
             
             if ALLURE_AVAILABLE:
                 allure.attach(server_out, "Server Output", allure.attachment_type.TEXT)
-                allure.attach(server_err, "Server Errors", allure.attachment_type.TEXT)
         
         assert "Connected to ws://localhost:3000" in output
         assert "[RECV]" in output  # Should receive at least one message
         assert "[SEND]" in output  # Should send a connect message
     finally:
-        server_proc.terminate()
+        watchdog.cancel()
         client_proc.terminate()
+        client_proc.wait(timeout=5)
+        client_proc.stdout.close()
+
+
+@pytest.fixture
+async def in_process_server():
+    """Run a WebSocketServer in the test's event loop on a free port."""
+    server = WebSocketServer(port=0, host="127.0.0.1")
+    server_task = asyncio.create_task(server.run_forever())
+    await asyncio.wait_for(server.wait_until_ready(), timeout=10)
+
+    yield server
+
+    await server.stop()
+    await asyncio.wait_for(server_task, timeout=10)
+    assert not server._mock_tasks  # no mock data tasks left pending
+
+
+@_apply_allure_decorators(
+    "WebSocket Server", "In-Process Server", "Test in-process server sends the server list on connect"
+)
+async def test_in_process_server_sends_server_list(in_process_server):
+    setup_allure_test_info()
+
+    async with websockets.connect(f"ws://127.0.0.1:{in_process_server.port}") as ws:
+        message = json.loads(await asyncio.wait_for(ws.recv(), timeout=5))
+
+    assert in_process_server.port != 0
+    assert message["type"] == "server-list"
+    assert "232769614004748288" in message["data"]
+
+
+async def _recv_until(ws, message_type, match=None, timeout=5):
+    """Receive messages until one of the given type arrives, skipping mock traffic."""
+    async def recv_matching():
+        while True:
+            message = json.loads(await ws.recv())
+            if message["type"] == message_type and (match is None or match(message)):
+                return message
+
+    return await asyncio.wait_for(recv_matching(), timeout=timeout)
+
+
+@_apply_allure_decorators("WebSocket Server", "Broadcasting", "Test broadcast messages reach clients joined to the server")
+async def test_broadcast_message_reaches_joined_client(in_process_server):
+    setup_allure_test_info()
+
+    async with websockets.connect(f"ws://127.0.0.1:{in_process_server.port}") as ws:
+        await _recv_until(ws, "server-list")
+        await ws.send(json.dumps({"type": "connect", "data": {"server": "dworld"}}))
+        await _recv_until(ws, "server-join")
+        assert len(in_process_server._mock_tasks) == 2
+
+        await in_process_server.broadcast_message(
+            server="232769614004748288",
+            uid="123456789012345001",
+            message="Hello from the broadcast test",
+            channel="general"
+        )
+
+        # Mock messages can arrive in between, so look for the broadcast one
+        message = await _recv_until(
+            ws, "message", match=lambda m: m["data"]["message"] == "Hello from the broadcast test"
+        )
+
+    assert message["server"] == "232769614004748288"
+    assert message["data"] == {
+        "uid": "123456789012345001",
+        "message": "Hello from the broadcast test",
+        "channel": "general",
+    }
+
+
+@_apply_allure_decorators("WebSocket Server", "Server Lifecycle", "Test waiting for readiness fails when the server can't start")
+async def test_wait_until_ready_raises_when_server_fails_to_start():
+    setup_allure_test_info()
+
+    with socket.socket() as blocker:
+        blocker.bind(("127.0.0.1", 0))
+        blocker.listen()
+        server = WebSocketServer(port=blocker.getsockname()[1], host="127.0.0.1")
+        server_task = asyncio.create_task(server.run_forever())
+
+        with pytest.raises(OSError):
+            await asyncio.wait_for(server.wait_until_ready(), timeout=10)
+        with pytest.raises(OSError):
+            await server_task
+        # Waiting after the failure doesn't hang either
+        with pytest.raises(OSError):
+            await asyncio.wait_for(server.wait_until_ready(), timeout=10)
+
+
+@_apply_allure_decorators("WebSocket Server", "Server Lifecycle", "Test a stopped server is no longer reported as ready")
+async def test_stopped_server_is_no_longer_ready():
+    setup_allure_test_info()
+
+    server = WebSocketServer(port=0, host="127.0.0.1")
+    server_task = asyncio.create_task(server.start())
+    await asyncio.wait_for(server.wait_until_ready(), timeout=10)
+
+    await server.stop()
+    await asyncio.wait_for(server_task, timeout=10)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(server.wait_until_ready(), timeout=0.1)
+
+
+@_apply_allure_decorators("WebSocket Server", "Server Lifecycle", "Test run_forever returns after the server is stopped")
+async def test_run_forever_returns_after_stop():
+    setup_allure_test_info()
+
+    server = WebSocketServer(port=0, host="127.0.0.1")
+    server_task = asyncio.create_task(server.run_forever())
+    await asyncio.wait_for(server.wait_until_ready(), timeout=10)
+
+    await server.stop()
+    await asyncio.wait_for(server_task, timeout=10)
+
+
+@_apply_allure_decorators("WebSocket Server", "Server Lifecycle", "Test stopping the server wakes up readiness waiters")
+async def test_stop_wakes_up_pending_readiness_waiters():
+    setup_allure_test_info()
+
+    server = WebSocketServer(port=0, host="127.0.0.1")
+    waiter = asyncio.create_task(server.wait_until_ready())
+    await asyncio.sleep(0)  # let the waiter start waiting
+
+    await server.stop()
+
+    with pytest.raises(RuntimeError):
+        await asyncio.wait_for(waiter, timeout=10)
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32" or not hasattr(socket, "SO_REUSEPORT"),
+    reason="SO_REUSEPORT is not supported on this platform"
+)
+@_apply_allure_decorators("WebSocket Server", "Server Options", "Test two servers can share a port with reuse_port")
+async def test_reuse_port_lets_two_servers_share_a_port():
+    setup_allure_test_info()
+
+    first = WebSocketServer(port=0, host="127.0.0.1", reuse_port=True)
+    servers = [first]
+    tasks = [asyncio.create_task(first.run_forever())]
+    try:
+        await asyncio.wait_for(first.wait_until_ready(), timeout=10)
+        second = WebSocketServer(port=first.port, host="127.0.0.1", reuse_port=True)
+        servers.append(second)
+        tasks.append(asyncio.create_task(second.run_forever()))
+        await asyncio.wait_for(second.wait_until_ready(), timeout=10)
+
+        async with websockets.connect(f"ws://127.0.0.1:{first.port}") as ws:
+            message = await _recv_until(ws, "server-list")
+        assert "232769614004748288" in message["data"]
+    finally:
+        for server in servers:
+            await server.stop()
+        await asyncio.wait_for(asyncio.gather(*tasks, return_exceptions=True), timeout=10)
 
 # To run: pytest tests/test_server.py
\ No newline at end of file